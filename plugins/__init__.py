@@ -5,20 +5,33 @@ Automatically loads plugins without requiring server.py modifications.
 Safe for upstream pulls - all customizations stay in plugins/ directory.
 """
 
+import atexit
 import logging
 import os
-from typing import Any
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Plugins loaded by the first load_plugins() call, reused by later callers
+_loaded_plugins: Optional[dict[str, Any]] = None
+
 
 def load_plugins() -> dict[str, Any]:
     """
     Auto-load all plugins from plugins/ directory.
 
+    Plugins are initialized once per process; subsequent calls return the
+    same instances instead of re-running initialization (which would, for
+    example, start duplicate PromptCraft background workers).
+
     Returns:
         Dict of plugin_name -> plugin_instance
     """
+    global _loaded_plugins
+
+    if _loaded_plugins is not None:
+        return _loaded_plugins
+
     plugins = {}
 
     try:
@@ -59,9 +72,29 @@ def load_plugins() -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Failed to load PromptCraft system plugin: {e}")
 
+    _loaded_plugins = plugins
     return plugins
 
 
+def shutdown_plugins():
+    """
+    Stop background work started by loaded plugins.
+
+    Registered with atexit once, when this module is imported. Shutdown is
+    synchronous on purpose: the event loop is already gone at interpreter
+    exit, so any coroutine scheduled from here would never run.
+    """
+    for plugin_name, plugin in (_loaded_plugins or {}).items():
+        if hasattr(plugin, "shutdown"):
+            try:
+                plugin.shutdown()
+            except Exception as e:
+                logger.debug(f"Error shutting down {plugin_name} plugin: {e}")
+
+
+atexit.register(shutdown_plugins)
+
+
 def get_plugin_tools() -> dict[str, Any]:
     """
     Get tools provided by all loaded plugins.
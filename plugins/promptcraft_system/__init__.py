@@ -35,10 +35,17 @@ class PromptCraftSystemPlugin:
         self.name = "promptcraft_system"
         self.version = "1.0.0"
         self.api_server = None
-        self.background_workers = []
+        self.worker_manager = None
         self.data_manager = None
         self.initialized = False
 
+    @property
+    def background_workers(self) -> list:
+        """Workers currently run by the worker manager, which owns their lifecycle."""
+        if not self.worker_manager:
+            return []
+        return [worker_info["worker"] for worker_info in self.worker_manager.workers.values()]
+
     def initialize(self, data_dir: Optional[Path] = None) -> bool:
         """
         Initialize the PromptCraft system plugin.
@@ -114,6 +121,19 @@ class PromptCraftSystemPlugin:
             self.api_server.stop_server()
             logger.info("🛑 PromptCraft API server stopped")
 
+    def shutdown(self):
+        """
+        Stop background workers and the API server.
+
+        Runs from atexit, when log handlers may already be closed, so it does
+        not log and skips components that were never started.
+        """
+        if self.worker_manager:
+            self.worker_manager.stop_all_workers()
+            self.worker_manager = None
+        if self.api_server and self.api_server.is_running():
+            self.api_server.stop_server()
+
     def get_status(self) -> dict[str, Any]:
         """
         Get current plugin status and health information.
@@ -145,19 +165,11 @@ class PromptCraftSystemPlugin:
     def _start_background_workers(self):
         """Start background worker processes for model detection and graduation."""
         try:
-            from .background_workers import GraduationWorker, ModelDetectionWorker
-
-            # Start model detection worker
-            detection_worker = ModelDetectionWorker(self.data_manager)
-            detection_thread = threading.Thread(target=detection_worker.start, daemon=True)
-            detection_thread.start()
-            self.background_workers.append(detection_worker)
-
-            # Start graduation worker
-            graduation_worker = GraduationWorker(self.data_manager)
-            graduation_thread = threading.Thread(target=graduation_worker.start, daemon=True)
-            graduation_thread.start()
-            self.background_workers.append(graduation_worker)
+            from .background_workers import WorkerManager
+
+            # One scheduler thread drives model detection and graduation
+            self.worker_manager = WorkerManager(self.data_manager)
+            self.worker_manager.start_all_workers()
 
             logger.info(f"🔄 Started {len(self.background_workers)} background workers")
 
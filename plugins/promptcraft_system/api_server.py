@@ -9,38 +9,125 @@ import asyncio
 import logging
 import os
 import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
 from routing.complexity_analyzer import ComplexityAnalyzer
 
 # Import zen-mcp-server routing components
 from routing.model_level_router import ModelLevel, ModelLevelRouter
 
+from .data_manager import ModelChannel
+
 logger = logging.getLogger(__name__)
 
-# Rate limiting setup
-limiter = Limiter(key_func=get_remote_address)
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which is several times faster than stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Serialize responses with orjson when it is installed
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
+
+# CORS origins: the default PromptCraft origin plus an optional override
+ALLOWED_ORIGINS = list(
+    dict.fromkeys(["http://localhost:7860", os.getenv("PROMPTCRAFT_ORIGIN", "http://localhost:7860")])
+)
+
+# Request size limits; oversized bodies are refused before parsing
+MAX_REQUEST_BODY_BYTES = 256 * 1024
+MAX_PROMPT_LENGTH = 65536
+
+
+def _mock_delay_from_env() -> float:
+    """Read PROMPTCRAFT_MOCK_DELAY, falling back to 0.1s so a bad value cannot break the plugin import."""
+    value = os.getenv("PROMPTCRAFT_MOCK_DELAY", "0.1")
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"⚠️ Invalid PROMPTCRAFT_MOCK_DELAY {value!r}, using 0.1s")
+        return 0.1
+
+
+# Simulated model latency in seconds until real execution is wired in
+MOCK_EXECUTION_DELAY = _mock_delay_from_env()
+
+# Whether responses carry an X-Process-Time header (seconds, fixed precision)
+EMIT_TIMING_HEADER = os.getenv("PROMPTCRAFT_TIMING_HEADER", "true").lower() == "true"
+
+# User tier to routing level
+TIER_MAPPING = {
+    "free": ModelLevel.FREE,
+    "limited": ModelLevel.FREE,
+    "full": ModelLevel.JUNIOR,
+    "premium": ModelLevel.SENIOR,
+    "admin": ModelLevel.EXECUTIVE,
+}
+
+# Request channel name to data manager channel (anything else is stable)
+CHANNEL_MAPPING = {"experimental": ModelChannel.EXPERIMENTAL, "stable": ModelChannel.STABLE}
+
+# Rate limiting: 100 requests per minute per client and route
+RATE_LIMIT_CAPACITY = 100
+RATE_LIMIT_REFILL_PER_SECOND = RATE_LIMIT_CAPACITY / 60.0
+RATE_LIMIT_IDLE_SECONDS = 600.0
+
+
+class TokenBucket:
+    """Token bucket state for a single rate-limited client."""
+
+    __slots__ = ("tokens", "last")
+
+    def __init__(self, tokens: float, last: float):
+        self.tokens = tokens
+        self.last = last
+
+
+async def rate_limit(request: Request):
+    """FastAPI dependency enforcing a per-client, per-route token bucket."""
+    server = request.app.state.server
+    now = time.monotonic()
+    server._sweep_idle_buckets(now)
+
+    key = (request.url.path, request.client.host if request.client else "unknown")
+    bucket = server.rate_limit_buckets.get(key)
+    if bucket is None:
+        bucket = server.rate_limit_buckets[key] = TokenBucket(RATE_LIMIT_CAPACITY, now)
+    else:
+        bucket.tokens = min(RATE_LIMIT_CAPACITY, bucket.tokens + (now - bucket.last) * RATE_LIMIT_REFILL_PER_SECOND)
+        bucket.last = now
+
+    if bucket.tokens < 1:
+        raise HTTPException(status_code=429, detail="Rate limit exceeded")
+    bucket.tokens -= 1
 
 
 # Pydantic models for API requests/responses
 class RouteAnalysisRequest(BaseModel):
-    prompt: str = Field(..., description="The prompt to analyze")
+    prompt: str = Field(..., max_length=MAX_PROMPT_LENGTH, description="The prompt to analyze")
     user_tier: str = Field(..., description="User tier: free|limited|full|premium|admin")
     task_type: Optional[str] = Field(None, description="Optional task type hint")
 
 
 class SmartExecutionRequest(BaseModel):
-    prompt: str = Field(..., description="The enhanced prompt from Journey 1")
+    prompt: str = Field(..., max_length=MAX_PROMPT_LENGTH, description="The enhanced prompt from Journey 1")
     user_tier: str = Field(..., description="User tier: free|limited|full|premium|admin")
     channel: str = Field("stable", description="Model channel: stable|experimental")
     cost_optimization: bool = Field(True, description="Enable cost optimization")
@@ -54,6 +141,38 @@ class ModelListRequest(BaseModel):
     format: str = Field("ui", description="Response format: ui|api")
 
 
+_cached_timestamp = ("", 0.0)
+
+
+def _current_timestamp() -> str:
+    """Return the current ISO timestamp, recomputed at most once per second."""
+    global _cached_timestamp
+    now = time.monotonic()
+    timestamp, computed_at = _cached_timestamp
+    if not timestamp or now - computed_at >= 1.0:
+        timestamp = datetime.now().isoformat()
+        _cached_timestamp = (timestamp, now)
+    return timestamp
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Manage application startup and shutdown."""
+    logger.info("🚀 PromptCraft API Server starting...")
+    yield
+    logger.info("🛑 PromptCraft API Server shutting down...")
+
+
+@lru_cache(maxsize=1024)
+def _format_display_name(name: str, is_free: bool, specialization: str, score: float) -> str:
+    """Build a model display name; memoized since the same models are listed repeatedly."""
+    return (
+        f"{'🆓 ' if is_free else ''}⚡ {name}"
+        f"{f' - {specialization.upper()}' if specialization != 'general' else ''}"
+        f"{f' (Score: {score})' if score > 0 else ''}"
+    )
+
+
 class PromptCraftAPIServer:
     """
     FastAPI server providing PromptCraft integration endpoints.
@@ -75,51 +194,56 @@ class PromptCraftAPIServer:
         self.request_count = 0
         self.successful_requests = 0
         self.total_response_time = 0.0
+        self._start_time = time.monotonic()
+
+        # Short-lived cache of /models/available responses
+        self.models_cache: OrderedDict[tuple, tuple[dict[str, Any], float]] = OrderedDict()
+        self.models_cache_ttl = 30.0
+        self.max_models_cache_size = 64
+
+        # Token buckets for rate-limited routes, keyed by (path, client host)
+        self.rate_limit_buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._last_bucket_sweep = time.monotonic()
 
         self._setup_app()
 
+    def _sweep_idle_buckets(self, now: float):
+        """Drop buckets that have not been touched for RATE_LIMIT_IDLE_SECONDS."""
+        if now - self._last_bucket_sweep < RATE_LIMIT_IDLE_SECONDS:
+            return
+        self._last_bucket_sweep = now
+        for key, bucket in list(self.rate_limit_buckets.items()):
+            if now - bucket.last > RATE_LIMIT_IDLE_SECONDS:
+                del self.rate_limit_buckets[key]
+
     def _setup_app(self):
         """Initialize FastAPI application with middleware and routes."""
-
-        @asynccontextmanager
-        async def lifespan(app: FastAPI):
-            """Manage application startup and shutdown."""
-            logger.info("🚀 PromptCraft API Server starting...")
-            yield
-            logger.info("🛑 PromptCraft API Server shutting down...")
-
         # Create FastAPI app
         self.app = FastAPI(
             title="PromptCraft API",
             description="Zen MCP Server integration endpoints for PromptCraft",
             version="1.0.0",
-            lifespan=lifespan,
+            lifespan=_lifespan,
+            default_response_class=DEFAULT_RESPONSE_CLASS,
         )
 
-        # Add rate limiting
-        self.app.state.limiter = limiter
-        self.app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
-        # Add CORS middleware
-        allowed_origins = [
-            "http://localhost:7860",  # Default PromptCraft origin
-            os.getenv("PROMPTCRAFT_ORIGIN", "http://localhost:7860"),
-        ]
-
-        self.app.add_middleware(
-            CORSMiddleware,
-            allow_origins=allowed_origins,
-            allow_credentials=True,
-            allow_methods=["GET", "POST", "PUT", "DELETE"],
-            allow_headers=["*"],
-        )
-
-        # Add request timing middleware
+        # Add request timing middleware. It also rejects oversized request bodies
+        # before they are read and parsed, and turns unhandled endpoint errors into
+        # a 500 response, so handlers need no try/except of their own and failed
+        # requests are still counted in the metrics.
         @self.app.middleware("http")
         async def add_request_timing(request: Request, call_next):
-            start_time = time.time()
-            response = await call_next(request)
-            process_time = time.time() - start_time
+            start_time = time.perf_counter()
+            content_length = request.headers.get("content-length")
+            try:
+                if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BODY_BYTES:
+                    response = DEFAULT_RESPONSE_CLASS({"detail": "Request body too large"}, status_code=413)
+                else:
+                    response = await call_next(request)
+            except Exception:
+                logger.exception(f"Unhandled error on {request.url.path}")
+                response = DEFAULT_RESPONSE_CLASS({"detail": "Internal server error"}, status_code=500)
+            process_time = time.perf_counter() - start_time
 
             # Update metrics
             self.request_count += 1
@@ -127,177 +251,30 @@ class PromptCraftAPIServer:
                 self.successful_requests += 1
             self.total_response_time += process_time
 
-            response.headers["X-Process-Time"] = str(process_time)
+            if EMIT_TIMING_HEADER:
+                response.headers["X-Process-Time"] = format(process_time, ".6f")
             return response
 
-        # Register routes
-        self._register_routes()
-
-    def _register_routes(self):
-        """Register all API endpoints."""
-
-        @self.app.get("/health")
-        async def health_check():
-            """Health check endpoint for monitoring."""
-            return {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "service": "promptcraft-api",
-                "version": "1.0.0",
-            }
-
-        @self.app.post("/api/promptcraft/route/analyze")
-        @limiter.limit("100/minute")
-        async def analyze_route(request: Request, data: RouteAnalysisRequest):
-            """
-            Analyze prompt complexity and provide model recommendations.
-
-            This endpoint performs complexity analysis and returns routing recommendations
-            without actually executing the prompt.
-            """
-            try:
-                start_time = time.time()
-
-                # Analyze prompt complexity
-                analysis = await self._analyze_prompt_complexity(data.prompt, data.task_type)
-
-                # Get routing recommendations
-                recommendations = await self._get_routing_recommendations(analysis, data.user_tier)
-
-                processing_time = time.time() - start_time
-
-                return {
-                    "success": True,
-                    "analysis": {
-                        "task_type": analysis["task_type"],
-                        "complexity_score": analysis["complexity_score"],
-                        "complexity_level": analysis["complexity_level"],
-                        "indicators": analysis.get("indicators", []),
-                        "reasoning": analysis.get("reasoning", ""),
-                    },
-                    "recommendations": recommendations,
-                    "processing_time": processing_time,
-                }
-
-            except Exception as e:
-                logger.error(f"Route analysis error: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
-
-        @self.app.post("/api/promptcraft/execute/smart")
-        @limiter.limit("100/minute")
-        async def smart_execution(request: Request, data: SmartExecutionRequest):
-            """
-            Route and execute prompt in a single call with intelligence.
-
-            This endpoint combines complexity analysis, model selection, and execution
-            for seamless integration with PromptCraft applications.
-            """
-            try:
-                start_time = time.time()
-
-                # Analyze prompt complexity
-                analysis = await self._analyze_prompt_complexity(data.prompt)
-
-                # Select optimal model
-                selected_model = await self._select_optimal_model(
-                    analysis, data.user_tier, data.channel, data.cost_optimization
-                )
-
-                # Execute with selected model
-                execution_result = await self._execute_with_model(data.prompt, selected_model, analysis)
-
-                processing_time = time.time() - start_time
-
-                # Update model usage stats if experimental
-                if data.channel == "experimental":
-                    self.data_manager.update_model_usage(selected_model["id"], execution_result["success"])
-
-                return {
-                    "success": True,
-                    "result": {
-                        "content": execution_result["response"],
-                        "model_used": selected_model["id"],
-                        "model_tier": selected_model.get("tier", "unknown"),
-                        "task_type": analysis["task_type"],
-                        "complexity_score": analysis["complexity_score"],
-                        "complexity_level": analysis["complexity_level"],
-                        "selection_reasoning": selected_model.get("reasoning", ""),
-                        "estimated_cost": selected_model.get("estimated_cost", 0.0),
-                        "response_time": execution_result["response_time"],
-                        "confidence": execution_result.get("confidence", 0.0),
-                        "cost_optimized": data.cost_optimization,
-                        "fallback_models": selected_model.get("fallback_models", []),
-                        "performance_metrics": {
-                            "tokens_used": execution_result.get("tokens_used", 0),
-                            "processing_time": processing_time,
-                            "model_response_time": execution_result["response_time"],
-                        },
-                    },
-                }
-
-            except Exception as e:
-                logger.error(f"Smart execution error: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
-
-        @self.app.get("/api/promptcraft/models/available")
-        @limiter.limit("100/minute")
-        async def get_available_models(
-            request: Request,
-            user_tier: Optional[str] = None,
-            channel: str = "stable",
-            include_metadata: bool = True,
-            format: str = "ui",
-        ):
-            """
-            Get available models filtered by user tier and channel.
-
-            Returns models from either stable (verified) or experimental channels
-            based on user permissions and preferences.
-            """
-            try:
-                # Get models from appropriate channel
-                models = await self._get_models_by_channel(channel, user_tier)
-
-                # Format for UI or API consumption
-                if format == "ui":
-                    formatted_models = await self._format_models_for_ui(models)
-                else:
-                    formatted_models = models
-
-                return {
-                    "success": True,
-                    "models": formatted_models,
-                    "channel": channel,
-                    "user_tier": user_tier,
-                    "total_models": len(formatted_models),
-                    "channels_available": ["stable", "experimental"],
-                    "last_updated": datetime.now().isoformat(),
-                }
-
-            except Exception as e:
-                logger.error(f"Model list error: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
-
-        @self.app.get("/api/promptcraft/system/stats")
-        async def get_system_stats():
-            """Get system statistics and health metrics."""
-            try:
-                stats = self.data_manager.get_stats()
-
-                # Add API server metrics
-                stats["api_server"] = self.get_metrics()
-
-                return {"success": True, "stats": stats}
+        # Add CORS middleware last so it is outermost and also covers the
+        # 413 and 500 responses built by the timing middleware
+        self.app.add_middleware(
+            CORSMiddleware,
+            allow_origins=ALLOWED_ORIGINS,
+            allow_credentials=True,
+            allow_methods=["GET", "POST", "PUT", "DELETE"],
+            allow_headers=["*"],
+        )
 
-            except Exception as e:
-                logger.error(f"System stats error: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+        # Register routes
+        self.app.state.server = self
+        self.app.include_router(router)
 
     async def _analyze_prompt_complexity(self, prompt: str, task_type_hint: Optional[str] = None) -> dict[str, Any]:
         """Analyze prompt complexity using zen-mcp-server's complexity analyzer."""
         try:
-            # Use the existing complexity analyzer
-            analysis_result = self.complexity_analyzer.analyze(prompt)
+            # Use the existing complexity analyzer. Regex scanning of long prompts is
+            # CPU work, so run it in a worker thread to keep the event loop responsive.
+            analysis_result = await asyncio.to_thread(self.complexity_analyzer.analyze, prompt)
 
             # Convert to expected format
             return {
@@ -330,35 +307,13 @@ class PromptCraftAPIServer:
     async def _get_routing_recommendations(self, analysis: dict[str, Any], user_tier: str) -> dict[str, Any]:
         """Get model routing recommendations based on analysis and user tier."""
         try:
-            # Map user tier to ModelLevel
-            tier_mapping = {
-                "free": ModelLevel.FREE,
-                "limited": ModelLevel.FREE,
-                "full": ModelLevel.JUNIOR,
-                "premium": ModelLevel.SENIOR,
-                "admin": ModelLevel.EXECUTIVE,
-            }
-
-            model_level = tier_mapping.get(user_tier, ModelLevel.FREE)
-
-            # Get optimal model selection
-            selected_model = self.model_router.select_optimal_model(
-                complexity_score=analysis["complexity_score"],
-                task_type=analysis["task_type"],
-                user_level=model_level,
-                cost_optimization=True,
-            )
+            selected_model = self._route_primary_model(analysis, user_tier)
 
             # Get alternative models
             alternatives = self.model_router.get_fallback_models(selected_model, max_alternatives=3)
 
             return {
-                "primary": {
-                    "model_id": selected_model.name,
-                    "model_name": selected_model.display_name or selected_model.name,
-                    "tier": selected_model.tier,
-                    "reasoning": f"Selected for {analysis['task_type']} task with cost optimization",
-                },
+                "primary": self._format_primary_model(selected_model, analysis),
                 "alternatives": [
                     {"model_id": alt.name, "model_name": alt.display_name or alt.name, "tier": alt.tier}
                     for alt in alternatives
@@ -372,12 +327,7 @@ class PromptCraftAPIServer:
         except Exception as e:
             logger.error(f"Routing recommendations failed: {e}")
             return {
-                "primary": {
-                    "model_id": "fallback-model",
-                    "model_name": "Fallback Model",
-                    "tier": "free_champion",
-                    "reasoning": "Fallback due to routing error",
-                },
+                "primary": self._fallback_primary_model(),
                 "alternatives": [],
                 "cost_comparison": {"recommended_cost": 0.0, "premium_alternative_cost": 0.0},
             }
@@ -386,20 +336,51 @@ class PromptCraftAPIServer:
         self, analysis: dict[str, Any], user_tier: str, channel: str, cost_optimization: bool
     ) -> dict[str, Any]:
         """Select optimal model for execution."""
-        # Implementation similar to _get_routing_recommendations but focused on single best model
-        recommendations = await self._get_routing_recommendations(analysis, user_tier)
-        return recommendations["primary"]
+        # Only the primary model is needed here, so skip building the fallback list
+        try:
+            return self._format_primary_model(self._route_primary_model(analysis, user_tier), analysis)
+        except Exception as e:
+            logger.error(f"Model selection failed: {e}")
+            return self._fallback_primary_model()
+
+    def _route_primary_model(self, analysis: dict[str, Any], user_tier: str):
+        """Ask the router for the best model for this analysis and user tier."""
+        return self.model_router.select_optimal_model(
+            complexity_score=analysis["complexity_score"],
+            task_type=analysis["task_type"],
+            user_level=TIER_MAPPING.get(user_tier, ModelLevel.FREE),
+            cost_optimization=True,
+        )
+
+    def _format_primary_model(self, selected_model, analysis: dict[str, Any]) -> dict[str, Any]:
+        """Describe the selected primary model for API responses."""
+        return {
+            "model_id": selected_model.name,
+            "model_name": selected_model.display_name or selected_model.name,
+            "tier": selected_model.tier,
+            "reasoning": f"Selected for {analysis['task_type']} task with cost optimization",
+        }
+
+    def _fallback_primary_model(self) -> dict[str, Any]:
+        """Primary model entry used when routing fails."""
+        return {
+            "model_id": "fallback-model",
+            "model_name": "Fallback Model",
+            "tier": "free_champion",
+            "reasoning": "Fallback due to routing error",
+        }
 
     async def _execute_with_model(self, prompt: str, model: dict[str, Any], analysis: dict[str, Any]) -> dict[str, Any]:
         """Execute prompt with selected model."""
         # This would integrate with actual model execution
         # For now, return mock response
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        # Simulate model execution time
-        await asyncio.sleep(0.1)  # Mock execution delay
+        # Simulate model execution time (set PROMPTCRAFT_MOCK_DELAY=0 for benchmarks)
+        if MOCK_EXECUTION_DELAY > 0:
+            await asyncio.sleep(MOCK_EXECUTION_DELAY)
 
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
 
         return {
             "success": True,
@@ -411,12 +392,10 @@ class PromptCraftAPIServer:
 
     async def _get_models_by_channel(self, channel: str, user_tier: Optional[str]) -> list[dict[str, Any]]:
         """Get models filtered by channel and user tier."""
-        from .data_manager import ModelChannel
-
-        if channel == "experimental":
-            models = self.data_manager.get_models_by_channel(ModelChannel.EXPERIMENTAL)
-        else:
-            models = self.data_manager.get_models_by_channel(ModelChannel.STABLE)
+        # Channel lookups read JSON/CSV from disk; keep that off the event loop
+        models = await asyncio.to_thread(
+            self.data_manager.get_models_by_channel, CHANNEL_MAPPING.get(channel, ModelChannel.STABLE)
+        )
 
         # Filter by user tier if specified
         if user_tier:
@@ -449,16 +428,12 @@ class PromptCraftAPIServer:
 
     def _generate_display_name(self, model: dict[str, Any]) -> str:
         """Generate enhanced display name for UI."""
-        name = model.get("name", "Unknown")
-        model.get("tier", "")
-        specialization = model.get("specialization", "")
-        score = model.get("humaneval_score", 0.0)
-
-        prefix = "🆓 " if model.get("cost_per_token", 0) == 0 else ""
-        suffix = f" - {specialization.upper()}" if specialization != "general" else ""
-        score_suffix = f" (Score: {score})" if score > 0 else ""
-
-        return f"{prefix}⚡ {name}{suffix}{score_suffix}"
+        return _format_display_name(
+            model.get("name", "Unknown"),
+            model.get("cost_per_token", 0) == 0,
+            model.get("specialization", ""),
+            model.get("humaneval_score", 0.0),
+        )
 
     def start_server(self, host: str = "0.0.0.0", port: int = 3000):
         """Start the FastAPI server."""
@@ -469,13 +444,17 @@ class PromptCraftAPIServer:
                 port=port,
                 log_level="info",
                 access_log=False,  # We have our own request middleware
+                loop="auto",  # uvloop when installed, asyncio otherwise
+                http="auto",  # httptools when installed, h11 otherwise
+                ws="none",  # No websocket endpoints
             )
 
             self.server = uvicorn.Server(config)
             self.running = True
 
-            # Run server (this blocks)
-            asyncio.run(self.server.serve())
+            # Run server (this blocks). Server.run() applies the configured
+            # event loop, which a bare asyncio.run(server.serve()) would bypass.
+            self.server.run()
 
         except Exception as e:
             logger.error(f"Failed to start API server: {e}")
@@ -502,5 +481,167 @@ class PromptCraftAPIServer:
             "successful_requests": self.successful_requests,
             "success_rate": success_rate,
             "average_response_time": avg_response_time,
-            "uptime": time.time() - getattr(self, "_start_time", time.time()),
+            "uptime": time.monotonic() - self._start_time,
         }
+
+
+# API endpoints; handlers reach the owning PromptCraftAPIServer through app.state.server
+router = APIRouter()
+
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint for monitoring."""
+    return {
+        "status": "healthy",
+        "timestamp": _current_timestamp(),
+        "service": "promptcraft-api",
+        "version": "1.0.0",
+    }
+
+
+@router.post("/api/promptcraft/route/analyze", dependencies=[Depends(rate_limit)])
+async def analyze_route(request: Request, data: RouteAnalysisRequest):
+    """
+    Analyze prompt complexity and provide model recommendations.
+
+    This endpoint performs complexity analysis and returns routing recommendations
+    without actually executing the prompt.
+    """
+    server = request.app.state.server
+    start_time = time.perf_counter()
+
+    # Analyze prompt complexity
+    analysis = await server._analyze_prompt_complexity(data.prompt, data.task_type)
+
+    # Get routing recommendations
+    recommendations = await server._get_routing_recommendations(analysis, data.user_tier)
+
+    processing_time = time.perf_counter() - start_time
+
+    return {
+        "success": True,
+        "analysis": {
+            "task_type": analysis["task_type"],
+            "complexity_score": analysis["complexity_score"],
+            "complexity_level": analysis["complexity_level"],
+            "indicators": analysis.get("indicators", []),
+            "reasoning": analysis.get("reasoning", ""),
+        },
+        "recommendations": recommendations,
+        "processing_time": processing_time,
+    }
+
+
+@router.post("/api/promptcraft/execute/smart", dependencies=[Depends(rate_limit)])
+async def smart_execution(request: Request, data: SmartExecutionRequest):
+    """
+    Route and execute prompt in a single call with intelligence.
+
+    This endpoint combines complexity analysis, model selection, and execution
+    for seamless integration with PromptCraft applications.
+    """
+    server = request.app.state.server
+    start_time = time.perf_counter()
+
+    # Analyze prompt complexity
+    analysis = await server._analyze_prompt_complexity(data.prompt)
+
+    # Select optimal model
+    selected_model = await server._select_optimal_model(analysis, data.user_tier, data.channel, data.cost_optimization)
+
+    # Execute with selected model
+    execution_result = await server._execute_with_model(data.prompt, selected_model, analysis)
+
+    processing_time = time.perf_counter() - start_time
+
+    # Update model usage stats if experimental
+    if data.channel == "experimental":
+        await asyncio.to_thread(
+            server.data_manager.update_model_usage, selected_model["id"], execution_result["success"]
+        )
+
+    return {
+        "success": True,
+        "result": {
+            "content": execution_result["response"],
+            "model_used": selected_model["id"],
+            "model_tier": selected_model.get("tier", "unknown"),
+            "task_type": analysis["task_type"],
+            "complexity_score": analysis["complexity_score"],
+            "complexity_level": analysis["complexity_level"],
+            "selection_reasoning": selected_model.get("reasoning", ""),
+            "estimated_cost": selected_model.get("estimated_cost", 0.0),
+            "response_time": execution_result["response_time"],
+            "confidence": execution_result.get("confidence", 0.0),
+            "cost_optimized": data.cost_optimization,
+            "fallback_models": selected_model.get("fallback_models", []),
+            "performance_metrics": {
+                "tokens_used": execution_result.get("tokens_used", 0),
+                "processing_time": processing_time,
+                "model_response_time": execution_result["response_time"],
+            },
+        },
+    }
+
+
+@router.get("/api/promptcraft/models/available", dependencies=[Depends(rate_limit)])
+async def get_available_models(
+    request: Request,
+    user_tier: Optional[str] = None,
+    channel: str = "stable",
+    include_metadata: bool = True,
+    format: str = "ui",
+):
+    """
+    Get available models filtered by user tier and channel.
+
+    Returns models from either stable (verified) or experimental channels
+    based on user permissions and preferences.
+    """
+    server = request.app.state.server
+    cache_key = (channel, user_tier, include_metadata, format)
+    cached = server.models_cache.get(cache_key)
+    if cached is not None:
+        cached_response, timestamp = cached
+        if time.monotonic() - timestamp < server.models_cache_ttl:
+            server.models_cache.move_to_end(cache_key)
+            return cached_response
+        del server.models_cache[cache_key]
+
+    # Get models from appropriate channel
+    models = await server._get_models_by_channel(channel, user_tier)
+
+    # Format for UI or API consumption
+    if format == "ui":
+        formatted_models = await server._format_models_for_ui(models)
+    else:
+        formatted_models = models
+
+    response = {
+        "success": True,
+        "models": formatted_models,
+        "channel": channel,
+        "user_tier": user_tier,
+        "total_models": len(formatted_models),
+        "channels_available": ["stable", "experimental"],
+        "last_updated": _current_timestamp(),
+    }
+
+    server.models_cache[cache_key] = (response, time.monotonic())
+    if len(server.models_cache) > server.max_models_cache_size:
+        server.models_cache.popitem(last=False)
+
+    return response
+
+
+@router.get("/api/promptcraft/system/stats")
+async def get_system_stats(request: Request):
+    """Get system statistics and health metrics."""
+    server = request.app.state.server
+    stats = await asyncio.to_thread(server.data_manager.get_stats)
+
+    # Add API server metrics
+    stats["api_server"] = server.get_metrics()
+
+    return {"success": True, "stats": stats}
@@ -6,19 +6,82 @@ of experimental models to stable channel based on performance criteria.
 """
 
 import logging
+import re
+import sched
 import threading
 import time
+from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 import requests
 
-from .data_manager import ExperimentalModel, GraduationCandidate, ModelChannel
+from .data_manager import ExperimentalModel, GraduationCandidate
 
 logger = logging.getLogger(__name__)
 
+# Longest single wait, so interval changes take effect without a restart
+MAX_WAIT_SECONDS = 60.0
 
-class ModelDetectionWorker:
+
+class IntervalWorker(ABC):
+    """
+    Shared scheduling for workers that run a cycle every N hours.
+
+    Cycles can be requested early with trigger_now(), the interval can be
+    changed at runtime with set_interval(), and stop() wakes the worker at once.
+    """
+
+    def __init__(self, data_manager, check_interval_hours: float):
+        self.data_manager = data_manager
+        self.check_interval_hours = check_interval_hours
+        self.running = False
+        self.stop_event = threading.Event()
+        self.trigger_event = threading.Event()
+        self._last_cycle = time.monotonic()
+
+    def stop(self):
+        """Stop the worker."""
+        self.stop_event.set()
+        self.trigger_event.set()
+        self.running = False
+
+    def trigger_now(self):
+        """Run the next cycle immediately instead of waiting for the interval."""
+        self.trigger_event.set()
+
+    def set_interval(self, hours: float):
+        """Change the cycle interval; takes effect within MAX_WAIT_SECONDS."""
+        self.check_interval_hours = hours
+
+    @abstractmethod
+    def run_cycle(self):
+        """Run a single work cycle."""
+
+    def seconds_until_due(self) -> float:
+        """Seconds until the next cycle is due (negative when overdue)."""
+        return self._last_cycle + self.check_interval_hours * 3600 - time.monotonic()
+
+    def claim_cycle(self) -> bool:
+        """Consume a pending trigger or elapsed interval; True when a cycle should run now."""
+        if self.stop_event.is_set():
+            return False
+        if self.trigger_event.is_set() or self.seconds_until_due() <= 0:
+            self.trigger_event.clear()
+            self._last_cycle = time.monotonic()
+            return True
+        return False
+
+    def _wait_for_next_cycle(self) -> bool:
+        """Block until the next cycle is due or triggered; False once stopped."""
+        while not self.stop_event.is_set():
+            self.trigger_event.wait(min(max(self.seconds_until_due(), 0.0), MAX_WAIT_SECONDS))
+            if self.claim_cycle():
+                return True
+        return False
+
+
+class ModelDetectionWorker(IntervalWorker):
     """
     Background worker for detecting new models from OpenRouter API.
 
@@ -30,17 +93,28 @@ class ModelDetectionWorker:
     """
 
     def __init__(self, data_manager, check_interval_hours: int = 6):
-        self.data_manager = data_manager
-        self.check_interval_hours = check_interval_hours
-        self.running = False
-        self.stop_event = threading.Event()
+        super().__init__(data_manager, check_interval_hours)
+
+        # Validators from the last OpenRouter response, for conditional requests
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._cached_models: list[dict[str, Any]] = []
+
+        # Reuse one connection pool across cycles instead of reconnecting each time
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = "zen-mcp-server/1.0"
+
+    def stop(self):
+        """Stop the worker and release its HTTP connections."""
+        super().stop()
+        self._session.close()
 
     def start(self):
         """Start the model detection worker loop."""
         self.running = True
         logger.info(f"🔍 Starting model detection worker (every {self.check_interval_hours}h)")
 
-        while not self.stop_event.wait(self.check_interval_hours * 3600):
+        while self._wait_for_next_cycle():
             try:
                 self._detection_cycle()
             except Exception as e:
@@ -48,10 +122,9 @@ class ModelDetectionWorker:
 
         logger.info("🛑 Model detection worker stopped")
 
-    def stop(self):
-        """Stop the model detection worker."""
-        self.stop_event.set()
-        self.running = False
+    def run_cycle(self):
+        """Run one model detection cycle."""
+        self._detection_cycle()
 
     def _detection_cycle(self):
         """Run a single model detection cycle."""
@@ -72,13 +145,16 @@ class ModelDetectionWorker:
             new_models = self._find_new_models(openrouter_models, known_models)
 
             # Apply quality filters
-            qualified_models = self._apply_quality_filters(new_models)
+            config = self.data_manager.get_graduation_criteria()
+            qualified_models = self._apply_quality_filters(new_models, config)
 
-            # Add to experimental channel
-            added_count = 0
-            for model_data in qualified_models:
-                if self._add_to_experimental(model_data):
-                    added_count += 1
+            # Add to experimental channel in one write, stamped with one timestamp per cycle
+            now_iso = datetime.now().isoformat()
+            experimental_models = [
+                self._build_experimental_model(model_data, now_iso) for model_data in qualified_models
+            ]
+            experimental_models = [model for model in experimental_models if model is not None]
+            added_count = self.data_manager.add_experimental_models(experimental_models) if experimental_models else 0
 
             duration = time.time() - start_time
             logger.info(f"✅ Detection cycle complete: {added_count} new models added (took {duration:.2f}s)")
@@ -91,14 +167,30 @@ class ModelDetectionWorker:
         try:
             # OpenRouter models API endpoint
             url = "https://openrouter.ai/api/v1/models"
-            headers = {"User-Agent": "zen-mcp-server/1.0"}
+            headers = {}
+
+            # Ask the server to skip the body if the catalogue has not changed
+            if self._cached_models:
+                if self._etag:
+                    headers["If-None-Match"] = self._etag
+                if self._last_modified:
+                    headers["If-Modified-Since"] = self._last_modified
+
+            response = self._session.get(url, headers=headers, timeout=30)
+
+            if response.status_code == 304:
+                logger.info(f"📥 OpenRouter model list unchanged ({len(self._cached_models)} models)")
+                return self._cached_models
 
-            response = requests.get(url, headers=headers, timeout=30)
             response.raise_for_status()
 
             data = response.json()
             models = data.get("data", [])
 
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._cached_models = models
+
             logger.info(f"📥 Fetched {len(models)} models from OpenRouter")
             return models
 
@@ -106,63 +198,59 @@ class ModelDetectionWorker:
             logger.error(f"❌ Failed to fetch OpenRouter models: {e}")
             return []
 
-    def _get_known_models(self) -> set:
+    def _get_known_models(self) -> frozenset[str]:
         """Get set of known model IDs (stable + experimental)."""
-        known_ids = set()
-
         try:
-            # Get stable models
-            stable_models = self.data_manager.get_models_by_channel(ModelChannel.STABLE)
-            known_ids.update(model.get("id", model.get("name", "")) for model in stable_models)
-
-            # Get experimental models
-            experimental_models = self.data_manager.get_experimental_models()
-            known_ids.update(model.id for model in experimental_models)
-
+            known_ids = self.data_manager.get_known_model_ids()
             logger.debug(f"📊 Known models: {len(known_ids)}")
             return known_ids
 
         except Exception as e:
             logger.error(f"❌ Failed to get known models: {e}")
-            return set()
+            return frozenset()
 
-    def _find_new_models(self, openrouter_models: list[dict[str, Any]], known_models: set) -> list[dict[str, Any]]:
+    def _find_new_models(
+        self, openrouter_models: list[dict[str, Any]], known_models: frozenset[str]
+    ) -> list[dict[str, Any]]:
         """Find models that aren't in our known set."""
-        new_models = []
-
-        for model in openrouter_models:
-            model_id = model.get("id", "")
-            if model_id and model_id not in known_models:
-                new_models.append(model)
+        new_models = [model for model in openrouter_models if model.get("id") and model["id"] not in known_models]
 
         logger.info(f"🆕 Found {len(new_models)} new models")
         return new_models
 
-    def _apply_quality_filters(self, models: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _apply_quality_filters(
+        self, models: list[dict[str, Any]], config: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
         """Apply quality filters to new models."""
         qualified = []
 
         # Get quality filter configuration
-        config = self.data_manager.get_graduation_criteria()
+        if config is None:
+            config = self.data_manager.get_graduation_criteria()
         quality_filters = config.get("detection_config", {}).get("quality_filters", {})
 
         min_context = quality_filters.get("min_context_window", 4000)
         excluded_providers = quality_filters.get("exclude_providers", [])
 
+        # One case-insensitive pattern instead of a substring test per excluded provider
+        excluded_pattern = (
+            re.compile("|".join(re.escape(provider) for provider in excluded_providers), re.IGNORECASE)
+            if excluded_providers
+            else None
+        )
+
+        # Cheapest checks first so most rejected models never reach the regex
         for model in models:
-            # Check context window
-            context_window = model.get("context_length", 0)
-            if context_window < min_context:
+            # Check if model has reasonable pricing info
+            if not model.get("pricing"):
                 continue
 
-            # Check provider exclusions
-            model_id = model.get("id", "")
-            if any(excluded in model_id.lower() for excluded in excluded_providers):
+            # Check context window
+            if model.get("context_length", 0) < min_context:
                 continue
 
-            # Check if model has reasonable pricing info
-            pricing = model.get("pricing", {})
-            if not pricing:
+            # Check provider exclusions
+            if excluded_pattern and excluded_pattern.search(model.get("id") or ""):
                 continue
 
             qualified.append(model)
@@ -170,21 +258,22 @@ class ModelDetectionWorker:
         logger.info(f"✅ {len(qualified)} models passed quality filters")
         return qualified
 
-    def _add_to_experimental(self, openrouter_model: dict[str, Any]) -> bool:
-        """Add a new model to experimental channel."""
+    def _build_experimental_model(
+        self, openrouter_model: dict[str, Any], now_iso: Optional[str] = None
+    ) -> Optional[ExperimentalModel]:
+        """Build an experimental channel entry from an OpenRouter model."""
         try:
             # Extract pricing
             pricing = openrouter_model.get("pricing", {})
             input_cost = float(pricing.get("prompt", "0").replace("$", ""))
 
-            # Create experimental model
-            experimental_model = ExperimentalModel(
+            return ExperimentalModel(
                 id=openrouter_model["id"],
                 name=openrouter_model.get("name", openrouter_model["id"]),
                 provider=openrouter_model["id"].split("/")[0] if "/" in openrouter_model["id"] else "unknown",
                 cost_per_token=input_cost,
                 context_window=openrouter_model.get("context_length", 0),
-                added_date=datetime.now().isoformat(),
+                added_date=now_iso or datetime.now().isoformat(),
                 usage_count=0,
                 success_rate=0.0,
                 humaneval_score=None,
@@ -192,19 +281,12 @@ class ModelDetectionWorker:
                 graduation_eligible=False,
             )
 
-            # Add to data manager
-            success = self.data_manager.add_experimental_model(experimental_model)
-            if success:
-                logger.info(f"➕ Added experimental model: {experimental_model.id}")
-
-            return success
-
         except Exception as e:
-            logger.error(f"❌ Failed to add experimental model: {e}")
-            return False
+            logger.error(f"❌ Failed to build experimental model: {e}")
+            return None
 
 
-class GraduationWorker:
+class GraduationWorker(IntervalWorker):
     """
     Background worker for graduating experimental models to stable channel.
 
@@ -216,17 +298,14 @@ class GraduationWorker:
     """
 
     def __init__(self, data_manager, check_interval_hours: int = 24):
-        self.data_manager = data_manager
-        self.check_interval_hours = check_interval_hours
-        self.running = False
-        self.stop_event = threading.Event()
+        super().__init__(data_manager, check_interval_hours)
 
     def start(self):
         """Start the graduation worker loop."""
         self.running = True
         logger.info(f"🎓 Starting graduation worker (every {self.check_interval_hours}h)")
 
-        while not self.stop_event.wait(self.check_interval_hours * 3600):
+        while self._wait_for_next_cycle():
             try:
                 self._graduation_cycle()
             except Exception as e:
@@ -234,10 +313,9 @@ class GraduationWorker:
 
         logger.info("🛑 Graduation worker stopped")
 
-    def stop(self):
-        """Stop the graduation worker."""
-        self.stop_event.set()
-        self.running = False
+    def run_cycle(self):
+        """Run one graduation cycle."""
+        self._graduation_cycle()
 
     def _graduation_cycle(self):
         """Run a single graduation evaluation cycle."""
@@ -251,17 +329,19 @@ class GraduationWorker:
             # Get experimental models
             experimental_models = self.data_manager.get_experimental_models()
 
-            # Check each model for graduation eligibility
+            # Check each model for graduation eligibility against one reference time
+            now = datetime.now(timezone.utc)
+            now_iso = datetime.now().isoformat()
             candidates = []
             for model in experimental_models:
-                candidate = self._evaluate_graduation_eligibility(model, criteria)
+                candidate = self._evaluate_graduation_eligibility(model, criteria, now, now_iso)
                 if candidate and candidate.graduation_score >= 7.5:  # Threshold for graduation
                     candidates.append(candidate)
 
             # Run benchmarks on candidates
             benchmarked_candidates = []
             for candidate in candidates:
-                benchmark_result = self._run_benchmarks(candidate)
+                benchmark_result = self._run_benchmarks(candidate, criteria)
                 if benchmark_result:
                     benchmarked_candidates.append(benchmark_result)
 
@@ -278,56 +358,68 @@ class GraduationWorker:
             logger.error(f"❌ Graduation cycle failed: {e}")
 
     def _evaluate_graduation_eligibility(
-        self, model: ExperimentalModel, criteria: dict[str, Any]
+        self,
+        model: ExperimentalModel,
+        criteria: dict[str, Any],
+        now: Optional[datetime] = None,
+        now_iso: Optional[str] = None,
     ) -> Optional[GraduationCandidate]:
         """Evaluate if a model is eligible for graduation."""
         try:
-            # Check age requirement
+            if now is None:
+                now = datetime.now(timezone.utc)
+
+            # Check age requirement. Models added by the detection worker carry
+            # naive local timestamps, so treat those as local time.
             added_date = datetime.fromisoformat(model.added_date.replace("Z", "+00:00"))
-            days_in_experimental = (datetime.now(timezone.utc) - added_date).days
+            if added_date.tzinfo is None:
+                added_date = added_date.astimezone()
+            days_in_experimental = (now - added_date).days
 
             min_age_days = criteria.get("minimum_age_days", 7)
             min_usage = criteria.get("minimum_usage_requests", 50)
             min_success_rate = criteria.get("minimum_success_rate", 0.95)
 
-            # Evaluate criteria
-            criteria_met = {
-                "age_requirement": days_in_experimental >= min_age_days,
-                "usage_requirement": model.usage_count >= min_usage,
-                "success_rate_requirement": model.success_rate >= min_success_rate,
-                "has_benchmark_score": model.humaneval_score is not None,
-            }
+            # Only create candidate if basic criteria are met
+            if (
+                days_in_experimental < min_age_days
+                or model.usage_count < min_usage
+                or model.success_rate < min_success_rate
+                or model.humaneval_score is None
+            ):
+                return None
 
             # Calculate graduation score
-            score_components = {
-                "age_score": min(days_in_experimental / min_age_days, 2.0) * 2.0,  # Max 4.0
-                "usage_score": min(model.usage_count / min_usage, 2.0) * 1.5,  # Max 3.0
-                "success_rate_score": model.success_rate * 2.0,  # Max 2.0
-                "benchmark_score": (model.humaneval_score or 0) / 100.0 * 1.0,  # Max 1.0
-            }
-
-            graduation_score = sum(score_components.values())
-
-            # Only create candidate if basic criteria are met
-            if all(criteria_met.values()):
-                return GraduationCandidate(
-                    model_id=model.id,
-                    added_to_queue=datetime.now().isoformat(),
-                    usage_count=model.usage_count,
-                    success_rate=model.success_rate,
-                    humaneval_score=model.humaneval_score,
-                    days_in_experimental=days_in_experimental,
-                    graduation_score=graduation_score,
-                    criteria_met=criteria_met,
-                )
+            graduation_score = (
+                min(days_in_experimental / min_age_days, 2.0) * 2.0  # Max 4.0
+                + min(model.usage_count / min_usage, 2.0) * 1.5  # Max 3.0
+                + model.success_rate * 2.0  # Max 2.0
+                + model.humaneval_score / 100.0  # Max 1.0
+            )
 
-            return None
+            return GraduationCandidate(
+                model_id=model.id,
+                added_to_queue=now_iso or datetime.now().isoformat(),
+                usage_count=model.usage_count,
+                success_rate=model.success_rate,
+                humaneval_score=model.humaneval_score,
+                days_in_experimental=days_in_experimental,
+                graduation_score=graduation_score,
+                criteria_met={
+                    "age_requirement": True,
+                    "usage_requirement": True,
+                    "success_rate_requirement": True,
+                    "has_benchmark_score": True,
+                },
+            )
 
         except Exception as e:
             logger.error(f"❌ Failed to evaluate graduation for {model.id}: {e}")
             return None
 
-    def _run_benchmarks(self, candidate: GraduationCandidate) -> Optional[GraduationCandidate]:
+    def _run_benchmarks(
+        self, candidate: GraduationCandidate, criteria: dict[str, Any]
+    ) -> Optional[GraduationCandidate]:
         """Run benchmarks on graduation candidate."""
         try:
             # For now, simulate benchmarking
@@ -339,7 +431,7 @@ class GraduationWorker:
                 candidate.humaneval_score = simulated_score
 
                 # Update criteria met
-                min_humaneval = self.data_manager.get_graduation_criteria().get("minimum_humaneval_score", 70.0)
+                min_humaneval = criteria.get("minimum_humaneval_score", 70.0)
                 candidate.criteria_met["benchmark_requirement"] = simulated_score >= min_humaneval
 
                 # Recalculate graduation score with benchmark
@@ -380,7 +472,8 @@ class WorkerManager:
     Manages lifecycle of all background workers.
 
     Provides centralized control for starting/stopping workers
-    and monitoring their health status.
+    and monitoring their health status. All workers are driven by a
+    single scheduler thread rather than one sleeping thread each.
     """
 
     def __init__(self, data_manager):
@@ -388,20 +481,22 @@ class WorkerManager:
         self.workers = {}
         self.running = False
 
+        self._scheduler = sched.scheduler(time.monotonic, self._delay)
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
     def start_all_workers(self):
         """Start all background workers."""
         try:
-            # Start model detection worker
-            detection_worker = ModelDetectionWorker(self.data_manager)
-            detection_thread = threading.Thread(target=detection_worker.start, name="ModelDetectionWorker", daemon=True)
-            detection_thread.start()
-            self.workers["model_detection"] = {"worker": detection_worker, "thread": detection_thread}
-
-            # Start graduation worker
-            graduation_worker = GraduationWorker(self.data_manager)
-            graduation_thread = threading.Thread(target=graduation_worker.start, name="GraduationWorker", daemon=True)
-            graduation_thread.start()
-            self.workers["graduation"] = {"worker": graduation_worker, "thread": graduation_thread}
+            self.workers["model_detection"] = {"worker": ModelDetectionWorker(self.data_manager), "event": None}
+            self.workers["graduation"] = {"worker": GraduationWorker(self.data_manager), "event": None}
+
+            for name, worker_info in self.workers.items():
+                worker_info["worker"].running = True
+                self._schedule(name, worker_info, 0)
+
+            self._thread = threading.Thread(target=self._scheduler.run, name="PromptCraftWorkers", daemon=True)
+            self._thread.start()
 
             self.running = True
             logger.info(f"🚀 Started {len(self.workers)} background workers")
@@ -410,32 +505,98 @@ class WorkerManager:
             logger.error(f"❌ Failed to start workers: {e}")
             self.stop_all_workers()
 
+    def _delay(self, seconds: float):
+        """Sleep until the next job is due, waking early when the schedule changes."""
+        if self._wake_event.wait(seconds):
+            self._wake_event.clear()
+
+    def _schedule(self, name: str, worker_info: dict[str, Any], delay: float):
+        """Queue the next check for a worker."""
+        worker_info["event"] = self._scheduler.enter(delay, 1, self._run_worker, (name,))
+
+    def _run_worker(self, name: str):
+        """Run a worker's cycle if it is due, then queue its next check."""
+        worker_info = self.workers.get(name)
+        if worker_info is None:
+            return
+
+        worker = worker_info["worker"]
+        if worker.stop_event.is_set():
+            return
+
+        if worker.claim_cycle():
+            try:
+                worker.run_cycle()
+            except Exception as e:
+                logger.error(f"❌ {name} cycle failed: {e}")
+
+        if worker.stop_event.is_set():
+            return
+
+        # A trigger that arrived during the cycle runs next; otherwise re-check
+        # at least every MAX_WAIT_SECONDS so set_interval() changes apply
+        if worker.trigger_event.is_set():
+            delay = 0.0
+        else:
+            delay = min(max(worker.seconds_until_due(), 0.0), MAX_WAIT_SECONDS)
+        self._schedule(name, worker_info, delay)
+
+    def trigger_now(self, name: Optional[str] = None):
+        """Request an immediate cycle from one worker, or from all workers when no name is given."""
+        # Snapshot, since stop_all_workers() may clear the dict from another thread
+        for worker_name, worker_info in list(self.workers.items()):
+            if name is None or worker_name == name:
+                worker_info["worker"].trigger_now()
+                self._reschedule_now(worker_name, worker_info)
+        self._wake_event.set()
+
+    def _reschedule_now(self, name: str, worker_info: dict[str, Any]):
+        """Move a worker's queued check to the front of the schedule."""
+        event = worker_info["event"]
+        if event is None:
+            return
+        try:
+            self._scheduler.cancel(event)
+        except ValueError:
+            # The check is already running; it sees the trigger and queues its successor immediately
+            return
+        self._schedule(name, worker_info, 0)
+
     def stop_all_workers(self):
-        """Stop all background workers gracefully."""
-        logger.info("🛑 Stopping all background workers...")
+        """
+        Stop all background workers gracefully.
 
+        Also called from interpreter exit, when log handlers may already be
+        closed, so only failures are logged.
+        """
         for name, worker_info in self.workers.items():
             try:
                 worker_info["worker"].stop()
-                logger.info(f"✅ Stopped {name} worker")
             except Exception as e:
                 logger.error(f"❌ Error stopping {name} worker: {e}")
 
+        for event in self._scheduler.queue:
+            try:
+                self._scheduler.cancel(event)
+            except ValueError:
+                pass
+        self._wake_event.set()
+
         self.workers.clear()
         self.running = False
 
     def get_worker_status(self) -> dict[str, Any]:
         """Get status of all workers."""
         status = {"manager_running": self.running, "total_workers": len(self.workers), "workers": {}}
+        thread = self._thread
 
         for name, worker_info in self.workers.items():
             worker = worker_info["worker"]
-            thread = worker_info["thread"]
 
             status["workers"][name] = {
                 "running": worker.running,
-                "thread_alive": thread.is_alive(),
-                "thread_name": thread.name,
+                "thread_alive": thread is not None and thread.is_alive(),
+                "thread_name": thread.name if thread is not None else None,
             }
 
         return status
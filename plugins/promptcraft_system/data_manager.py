@@ -16,6 +16,9 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Stable channel catalogue, relative to the server's working directory
+STABLE_MODELS_CSV = Path("docs/models/models.csv")
+
 
 class ModelChannel(Enum):
     STABLE = "stable"
@@ -81,6 +84,10 @@ class PromptCraftDataManager:
         # Thread lock for concurrent access (RLock allows re-entry from same thread)
         self._lock = threading.RLock()
 
+        # IDs of stable + experimental models, keyed by the source files' modification times
+        self._known_ids_cache: Optional[frozenset[str]] = None
+        self._known_ids_signature: Optional[tuple] = None
+
         # Initialize files if they don't exist
         self._initialize_data_files()
 
@@ -116,12 +123,18 @@ class PromptCraftDataManager:
         for file_path, default_content in default_files.items():
             if not file_path.exists():
                 try:
-                    with open(file_path, "w") as f:
-                        json.dump(default_content, f, indent=2)
+                    self._write_json(file_path, default_content)
                     logger.info(f"✅ Initialized {file_path.name}")
                 except Exception as e:
                     logger.error(f"❌ Failed to initialize {file_path.name}: {e}")
 
+    @staticmethod
+    def _write_json(file_path: Path, data: Any):
+        """Serialize data up front and write it with a single call."""
+        content = json.dumps(data, indent=2)
+        with open(file_path, "w") as f:
+            f.write(content)
+
     def get_experimental_models(self) -> list[ExperimentalModel]:
         """Get all experimental models."""
         with self._lock:
@@ -148,8 +161,8 @@ class PromptCraftDataManager:
                 models.append(model)
 
                 # Save to file
-                with open(self.experimental_models_path, "w") as f:
-                    json.dump([asdict(m) for m in models], f, indent=2)
+                self._write_json(self.experimental_models_path, [asdict(m) for m in models])
+                self._known_ids_cache = None
 
                 logger.info(f"✅ Added experimental model: {model.id}")
                 return True
@@ -158,6 +171,61 @@ class PromptCraftDataManager:
                 logger.error(f"❌ Failed to add experimental model {model.id}: {e}")
                 return False
 
+    def add_experimental_models(self, new_models: list[ExperimentalModel]) -> int:
+        """Add several experimental models with a single read and write; returns how many were added."""
+        with self._lock:
+            try:
+                models = self.get_experimental_models()
+                known_ids = {m.id for m in models}
+
+                added = []
+                for model in new_models:
+                    if model.id in known_ids:
+                        logger.warning(f"Model {model.id} already exists in experimental channel")
+                        continue
+                    known_ids.add(model.id)
+                    added.append(model)
+
+                if added:
+                    models.extend(added)
+                    self._write_json(self.experimental_models_path, [asdict(m) for m in models])
+                    self._known_ids_cache = None
+                    logger.info(f"✅ Added {len(added)} experimental models")
+
+                return len(added)
+
+            except Exception as e:
+                logger.error(f"❌ Failed to add experimental models: {e}")
+                return 0
+
+    @staticmethod
+    def _file_signature(file_path: Path) -> Optional[int]:
+        """Modification time of a file in nanoseconds, or None if it does not exist."""
+        try:
+            return file_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def get_known_model_ids(self) -> frozenset[str]:
+        """
+        Get IDs of all known models (stable + experimental).
+
+        The set is cached and rebuilt when experimental models are added or
+        when models.csv or the experimental models file changes on disk.
+        """
+        with self._lock:
+            signature = (
+                self._file_signature(STABLE_MODELS_CSV),
+                self._file_signature(self.experimental_models_path),
+            )
+            if self._known_ids_cache is None or signature != self._known_ids_signature:
+                stable_models = self.get_models_by_channel(ModelChannel.STABLE)
+                known_ids = {model.get("id", model.get("name", "")) for model in stable_models}
+                known_ids.update(model.id for model in self.get_experimental_models())
+                self._known_ids_cache = frozenset(known_ids)
+                self._known_ids_signature = signature
+            return self._known_ids_cache
+
     def update_model_usage(self, model_id: str, success: bool) -> bool:
         """Update usage statistics for a model."""
         with self._lock:
@@ -181,8 +249,7 @@ class PromptCraftDataManager:
                         break
 
                 # Save updated models
-                with open(self.experimental_models_path, "w") as f:
-                    json.dump([asdict(m) for m in models], f, indent=2)
+                self._write_json(self.experimental_models_path, [asdict(m) for m in models])
 
                 return True
 
@@ -214,8 +281,7 @@ class PromptCraftDataManager:
 
                 queue.append(candidate)
 
-                with open(self.graduation_queue_path, "w") as f:
-                    json.dump([asdict(c) for c in queue], f, indent=2)
+                self._write_json(self.graduation_queue_path, [asdict(c) for c in queue])
 
                 logger.info(f"✅ Added {candidate.model_id} to graduation queue")
                 return True
@@ -234,8 +300,7 @@ class PromptCraftDataManager:
                 queue = [c for c in queue if c.model_id != model_id]
 
                 if len(queue) < original_length:
-                    with open(self.graduation_queue_path, "w") as f:
-                        json.dump([asdict(c) for c in queue], f, indent=2)
+                    self._write_json(self.graduation_queue_path, [asdict(c) for c in queue])
                     logger.info(f"✅ Removed {model_id} from graduation queue")
                     return True
                 else:
@@ -267,8 +332,7 @@ class PromptCraftDataManager:
                 current_metrics.update(metrics)
                 current_metrics["last_updated"] = datetime.now().isoformat()
 
-                with open(self.performance_metrics_path, "w") as f:
-                    json.dump(current_metrics, f, indent=2)
+                self._write_json(self.performance_metrics_path, current_metrics)
 
                 return True
 
@@ -283,9 +347,8 @@ class PromptCraftDataManager:
             try:
                 import pandas as pd
 
-                models_csv_path = Path("docs/models/models.csv")
-                if models_csv_path.exists():
-                    df = pd.read_csv(models_csv_path)
+                if STABLE_MODELS_CSV.exists():
+                    df = pd.read_csv(STABLE_MODELS_CSV)
                     return df.to_dict("records")
                 else:
                     logger.debug("models.csv not found, returning empty list")
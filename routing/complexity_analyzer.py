@@ -26,10 +26,25 @@ class TaskType(Enum):
     GENERAL = "general"
 
 
+# Complexity score adjustment applied per task type
+TASK_TYPE_ADJUSTMENTS = {
+    TaskType.CODE_GENERATION: 0.1,
+    TaskType.DEBUGGING: 0.1,  # Reduced from 0.2 to avoid inflating simple debug tasks
+    TaskType.ANALYSIS: 0.15,
+    TaskType.PLANNING: 0.2,
+    TaskType.CODE_REVIEW: 0.1,
+    TaskType.DOCUMENTATION: -0.1,
+    TaskType.GENERAL: 0.0,
+}
+
+
 @dataclass
 class ComplexityIndicator:
     """Individual complexity indicator."""
 
+    # Several are built per analysis; slots keep them small (dataclass(slots=True) needs 3.10+)
+    __slots__ = ("name", "weight", "score", "evidence")
+
     name: str
     weight: float
     score: float
@@ -51,6 +66,21 @@ class ComplexityAnalyzer:
         self.task_type_patterns = self._load_task_type_patterns()
         self.file_type_complexity = self._load_file_type_complexity()
 
+        # Compile regexes once; analysis runs on every routed request
+        self._complexity_regexes = {
+            category: [re.compile(pattern) for pattern in config["patterns"]]
+            for category, config in self.complexity_patterns.items()
+            if "patterns" in config
+        }
+        self._task_type_regexes = {
+            task_type: [re.compile(pattern) for pattern in config["patterns"]]
+            for task_type, config in self.task_type_patterns.items()
+        }
+        self._task_type_keywords = {
+            task_type: tuple(keyword.lower() for keyword in config["keywords"])
+            for task_type, config in self.task_type_patterns.items()
+        }
+
     def _load_complexity_patterns(self) -> dict[str, dict[str, Any]]:
         """Load patterns for complexity detection."""
         return {
@@ -312,8 +342,11 @@ class ComplexityAnalyzer:
         """
         indicators = []
 
+        # Lowercase once and share it between the text and task type passes
+        prompt_lower = prompt.lower()
+
         # Analyze prompt text
-        text_indicators = self._analyze_text_complexity(prompt)
+        text_indicators = self._analyze_text_complexity(prompt, prompt_lower)
         indicators.extend(text_indicators)
 
         # Analyze context if provided
@@ -322,17 +355,18 @@ class ComplexityAnalyzer:
             indicators.extend(context_indicators)
 
         # Determine task type
-        task_type = self._classify_task_type(prompt, context)
+        task_type = self._classify_task_type(prompt, context, prompt_lower)
 
         # Calculate overall complexity
         complexity_level, confidence = self._calculate_complexity(indicators, task_type)
 
         return complexity_level, confidence, task_type
 
-    def _analyze_text_complexity(self, text: str) -> list[ComplexityIndicator]:
+    def _analyze_text_complexity(self, text: str, text_lower: Optional[str] = None) -> list[ComplexityIndicator]:
         """Analyze text content for complexity indicators."""
         indicators = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
 
         # Keyword-based analysis
         for category, config in self.complexity_patterns.items():
@@ -343,9 +377,8 @@ class ComplexityAnalyzer:
 
             if "patterns" in config:
                 matches = []
-                for pattern in config["patterns"]:
-                    pattern_matches = re.findall(pattern, text_lower)
-                    matches.extend(pattern_matches)
+                for pattern in self._complexity_regexes[category]:
+                    matches.extend(pattern.findall(text_lower))
 
                 if matches:
                     impact = config.get("complexity_impact", 0.0)
@@ -383,9 +416,8 @@ class ComplexityAnalyzer:
         # Code complexity analysis
         code_config = self.complexity_patterns["code_complexity"]
         code_matches = []
-        for pattern in code_config["patterns"]:
-            matches = re.findall(pattern, text)
-            code_matches.extend(matches)
+        for pattern in self._complexity_regexes["code_complexity"]:
+            code_matches.extend(pattern.findall(text))
 
         if code_matches:
             code_score = len(code_matches) * code_config["complexity_per_match"]
@@ -473,24 +505,26 @@ class ComplexityAnalyzer:
 
         return indicators
 
-    def _classify_task_type(self, prompt: str, context: Optional[dict[str, Any]] = None) -> TaskType:
+    def _classify_task_type(
+        self, prompt: str, context: Optional[dict[str, Any]] = None, prompt_lower: Optional[str] = None
+    ) -> TaskType:
         """Classify the task type based on prompt and context."""
         scores = {}
-        prompt_lower = prompt.lower()
+        if prompt_lower is None:
+            prompt_lower = prompt.lower()
 
         # Score each task type
         for task_type, config in self.task_type_patterns.items():
             score = 0.0
 
             # Keyword matching
-            for keyword in config["keywords"]:
-                if keyword.lower() in prompt_lower:
+            for keyword in self._task_type_keywords[task_type]:
+                if keyword in prompt_lower:
                     score += 1.0
 
             # Pattern matching
-            for pattern in config["patterns"]:
-                matches = re.findall(pattern, prompt_lower)
-                score += len(matches) * 2.0  # Pattern matches are stronger
+            for pattern in self._task_type_regexes[task_type]:
+                score += len(pattern.findall(prompt_lower)) * 2.0  # Pattern matches are stronger
 
             # Apply weight
             scores[task_type] = score * config["weight"]
@@ -523,17 +557,7 @@ class ComplexityAnalyzer:
         weighted_score = sum(ind.score * ind.weight for ind in indicators) / total_weight
 
         # Task type adjustments
-        task_type_adjustments = {
-            TaskType.CODE_GENERATION: 0.1,
-            TaskType.DEBUGGING: 0.1,  # Reduced from 0.2 to avoid inflating simple debug tasks
-            TaskType.ANALYSIS: 0.15,
-            TaskType.PLANNING: 0.2,
-            TaskType.CODE_REVIEW: 0.1,
-            TaskType.DOCUMENTATION: -0.1,
-            TaskType.GENERAL: 0.0,
-        }
-
-        adjusted_score = weighted_score + task_type_adjustments.get(task_type, 0.0)
+        adjusted_score = weighted_score + TASK_TYPE_ADJUSTMENTS.get(task_type, 0.0)
 
         # Determine complexity level
         # Thresholds calibrated so simple debugging/codegen tasks stay "simple"
@@ -559,16 +583,17 @@ class ComplexityAnalyzer:
     def get_analysis_details(self, prompt: str, context: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """Get detailed analysis breakdown for debugging/transparency."""
         indicators = []
+        prompt_lower = prompt.lower()
 
         # Analyze components
-        text_indicators = self._analyze_text_complexity(prompt)
+        text_indicators = self._analyze_text_complexity(prompt, prompt_lower)
         indicators.extend(text_indicators)
 
         if context:
             context_indicators = self._analyze_context_complexity(context)
             indicators.extend(context_indicators)
 
-        task_type = self._classify_task_type(prompt, context)
+        task_type = self._classify_task_type(prompt, context, prompt_lower)
         complexity_level, confidence = self._calculate_complexity(indicators, task_type)
 
         return {
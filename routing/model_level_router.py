@@ -5,10 +5,12 @@ Categorizes models into levels (free, junior, senior, executive) and
 provides intelligent selection based on task complexity and cost optimization.
 """
 
+import hashlib
 import json
 import logging
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
@@ -27,6 +29,21 @@ class ModelLevel(Enum):
     EXECUTIVE = "executive"
 
 
+# Levels in ascending order of capability and cost
+LEVEL_ORDER = tuple(ModelLevel)
+
+# Context fields read by ComplexityAnalyzer and _generate_reasoning; only these feed the cache key
+CACHE_KEY_CONTEXT_FIELDS = ("file_types", "errors", "error", "existing_code", "files", "tool_name")
+
+# Fallback complexity -> level mapping when routing config has no threshold
+DEFAULT_LEVEL_MAPPING = {
+    "simple": ModelLevel.FREE,
+    "moderate": ModelLevel.JUNIOR,
+    "complex": ModelLevel.SENIOR,
+    "expert": ModelLevel.EXECUTIVE,
+}
+
+
 @dataclass
 class ModelInfo:
     """Model information container."""
@@ -73,8 +90,9 @@ class ModelLevelRouter:
         self.complexity_analyzer = ComplexityAnalyzer()
         self.models: dict[str, ModelInfo] = {}
         self.level_models: dict[ModelLevel, list[ModelInfo]] = {level: [] for level in ModelLevel}
-        self.cache = {}
-        self.cache_ttl = 300  # 5 minutes
+        self.cache: OrderedDict[str, tuple[RoutingResult, float]] = OrderedDict()
+        self.cache_ttl = 300.0  # 5 minutes
+        self.max_cache_size = 1024
 
         self._load_configurations()
         self._initialize_models()
@@ -315,10 +333,13 @@ class ModelLevelRouter:
         cache_key = self._get_cache_key(prompt, context, prefer_free, max_cost)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_result, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl:
+        cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            cached_result, timestamp = cached
+            if time.monotonic() - timestamp < self.cache_ttl:
+                self.cache.move_to_end(cache_key)
                 return cached_result
+            del self.cache[cache_key]
 
         # Analyze task complexity and type
         complexity, confidence, task_type = self.analyze_task_complexity(prompt, context)
@@ -353,15 +374,50 @@ class ModelLevelRouter:
             estimated_cost=estimated_cost,
         )
 
-        # Cache result
-        self.cache[cache_key] = (result, time.time())
+        # Cache result, evicting the least recently used entry when full
+        if cache_key is not None:
+            self.cache[cache_key] = (result, time.monotonic())
+            self.cache.move_to_end(cache_key)
+            if len(self.cache) > self.max_cache_size:
+                self.cache.popitem(last=False)
 
         return result
 
-    def _get_cache_key(self, prompt: str, context: dict[str, Any], prefer_free: bool, max_cost: float) -> str:
-        """Generate cache key for model selection."""
-        context_str = str(sorted(context.items())) if context else ""
-        return f"{hash(prompt)}_{hash(context_str)}_{prefer_free}_{max_cost}"
+    def _get_cache_key(self, prompt: str, context: dict[str, Any], prefer_free: bool, max_cost: float) -> Optional[str]:
+        """
+        Generate cache key for model selection.
+
+        The prompt and the full contents of the context fields routing reads
+        (CACHE_KEY_CONTEXT_FIELDS) are hashed directly, so the key stays exact
+        for those fields while unrelated payloads such as session history are
+        never serialized. Returns None when a field cannot be hashed, in which
+        case the result is not cached.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            self._hash_value(digest, prompt)
+            if context:
+                for field_name in CACHE_KEY_CONTEXT_FIELDS:
+                    if field_name in context:
+                        digest.update(field_name.encode())
+                        self._hash_value(digest, context[field_name])
+        except Exception as e:
+            logger.debug(f"Skipping routing cache for unhashable context: {e}")
+            return None
+        return f"{digest.hexdigest()}_{prefer_free}_{max_cost}"
+
+    @staticmethod
+    def _hash_value(digest, value: Any):
+        """Feed one value into the digest with a type tag and length prefix so distinct values never collide."""
+        if isinstance(value, str):
+            # Large code strings are hashed as-is rather than serialized
+            data = value.encode("utf-8", "surrogatepass")
+            digest.update(b"s%d:" % len(data))
+        else:
+            # Lists of file names and error payloads go through the C JSON encoder in one call
+            data = json.dumps(value, sort_keys=True, default=repr).encode("utf-8", "surrogatepass")
+            digest.update(b"j%d:" % len(data))
+        digest.update(data)
 
     def _get_required_level(self, complexity: str, confidence: float) -> ModelLevel:
         """Determine required model level based on complexity analysis."""
@@ -373,14 +429,7 @@ class ModelLevelRouter:
                 return ModelLevel(threshold_config["max_level"])
 
         # Default mapping
-        level_mapping = {
-            "simple": ModelLevel.FREE,
-            "moderate": ModelLevel.JUNIOR,
-            "complex": ModelLevel.SENIOR,
-            "expert": ModelLevel.EXECUTIVE,
-        }
-
-        return level_mapping.get(complexity, ModelLevel.JUNIOR)
+        return DEFAULT_LEVEL_MAPPING.get(complexity, ModelLevel.JUNIOR)
 
     def _get_candidate_models(
         self, required_level: ModelLevel, task_type: TaskType, max_cost: float = None, prefer_free: bool = True
@@ -394,9 +443,7 @@ class ModelLevelRouter:
             levels_to_check.append(ModelLevel.FREE)
 
         # Add required level and potentially higher levels
-        current_level_index = list(ModelLevel).index(required_level)
-        for i in range(current_level_index, len(ModelLevel)):
-            level = list(ModelLevel)[i]
+        for level in LEVEL_ORDER[LEVEL_ORDER.index(required_level) :]:
             if level not in levels_to_check:
                 levels_to_check.append(level)
 
@@ -439,7 +486,7 @@ class ModelLevelRouter:
         """Get fallback models when no suitable models found."""
         fallbacks = []
 
-        for level in [ModelLevel.FREE, ModelLevel.JUNIOR, ModelLevel.SENIOR, ModelLevel.EXECUTIVE]:
+        for level in LEVEL_ORDER:
             for model in self.level_models[level]:
                 if model.is_available:
                     if max_cost is None or model.cost_per_token <= max_cost:
@@ -6,6 +6,7 @@ Focused tests for the essential PromptCraft components without complex scenarios
 
 import tempfile
 from datetime import datetime
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -127,5 +128,49 @@ def test_imports_work():
     assert ModelDetectionWorker is not None
 
 
+def test_load_plugins_is_idempotent(monkeypatch):
+    """Test that repeated load_plugins() calls reuse the first initialization."""
+    import plugins
+    from plugins import dynamic_routing_plugin, promptcraft_system
+
+    # Stand-in plugins, so the test starts no real workers or servers
+    routing_plugin = Mock()
+    promptcraft_plugin = Mock()
+    monkeypatch.setattr(dynamic_routing_plugin, "DynamicRoutingPlugin", Mock(return_value=routing_plugin))
+    monkeypatch.setattr(promptcraft_system, "plugin_instance", promptcraft_plugin)
+    monkeypatch.setenv("ENABLE_PROMPTCRAFT_API", "false")
+    monkeypatch.setattr(plugins, "_loaded_plugins", None)
+
+    first = plugins.load_plugins()
+    second = plugins.load_plugins()
+
+    assert second is first
+    assert first == {"dynamic_routing": routing_plugin, "promptcraft_system": promptcraft_plugin}
+    routing_plugin.initialize.assert_called_once()
+    promptcraft_plugin.initialize.assert_called_once()
+
+
+def test_plugin_shutdown_stops_workers():
+    """Test that plugin shutdown stops its background workers."""
+    from plugins.promptcraft_system import PromptCraftSystemPlugin
+    from plugins.promptcraft_system.background_workers import ModelDetectionWorker, WorkerManager
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_manager = PromptCraftDataManager(temp_dir)
+        worker = ModelDetectionWorker(data_manager)
+        plugin = PromptCraftSystemPlugin()
+        plugin.worker_manager = WorkerManager(data_manager)
+        plugin.worker_manager.workers["model_detection"] = {"worker": worker, "event": None}
+        assert plugin.background_workers == [worker]
+
+        with patch.object(worker._session, "close") as mock_close:
+            plugin.shutdown()
+
+        # Each worker is stopped exactly once, by the worker manager
+        mock_close.assert_called_once()
+        assert worker.stop_event.is_set()
+        assert plugin.background_workers == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -217,7 +217,7 @@ class TestBackgroundWorkers:
         if self.test_data_dir.exists():
             shutil.rmtree(self.test_data_dir)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_model_detection_worker(self, mock_get):
         """Test model detection from OpenRouter."""
         # Mock OpenRouter API response
@@ -7,6 +7,8 @@ using pytest conventions and fixtures.
 
 import shutil
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -15,7 +17,7 @@ import pytest
 
 from plugins.promptcraft_system import PromptCraftSystemPlugin
 from plugins.promptcraft_system.api_server import PromptCraftAPIServer
-from plugins.promptcraft_system.background_workers import GraduationWorker, ModelDetectionWorker
+from plugins.promptcraft_system.background_workers import GraduationWorker, ModelDetectionWorker, WorkerManager
 
 # Import PromptCraft components
 from plugins.promptcraft_system.data_manager import (
@@ -101,6 +103,50 @@ class TestDataManager:
         # Test duplicate prevention
         assert not data_manager.add_experimental_model(sample_experimental_model)
 
+    def test_add_experimental_models_bulk(self, data_manager, sample_experimental_model):
+        """Test adding several experimental models at once."""
+        data_manager.add_experimental_model(sample_experimental_model)
+        new_model = ExperimentalModel(
+            id="test/other-model:free",
+            name="Other Model",
+            provider="test",
+            cost_per_token=0.0,
+            context_window=8000,
+            added_date=datetime.now().isoformat(),
+        )
+
+        # Existing ids and duplicates within the batch are skipped
+        assert data_manager.add_experimental_models([sample_experimental_model, new_model, new_model]) == 1
+
+        model_ids = [m.id for m in data_manager.get_experimental_models()]
+        assert model_ids == [sample_experimental_model.id, new_model.id]
+
+    def test_known_model_ids_cached_until_add(self, data_manager, sample_experimental_model):
+        """Test that known model ids are cached and refreshed when models are added."""
+        with patch.object(data_manager, "get_models_by_channel", return_value=[{"id": "stable/model"}]) as mock_get:
+            assert data_manager.get_known_model_ids() == frozenset({"stable/model"})
+            assert data_manager.get_known_model_ids() == frozenset({"stable/model"})
+            assert mock_get.call_count == 1
+
+            data_manager.add_experimental_model(sample_experimental_model)
+
+            assert data_manager.get_known_model_ids() == frozenset({"stable/model", sample_experimental_model.id})
+            assert mock_get.call_count == 2
+
+    def test_known_model_ids_refresh_on_stable_csv_change(self, data_manager, monkeypatch, tmp_path):
+        """Test that a models.csv that appears or changes on disk refreshes the cached ids."""
+        from plugins.promptcraft_system import data_manager as data_module
+
+        csv_path = tmp_path / "models.csv"
+        monkeypatch.setattr(data_module, "STABLE_MODELS_CSV", csv_path)
+
+        with patch.object(data_manager, "get_models_by_channel", side_effect=[[], [{"id": "stable/model"}]]):
+            assert data_manager.get_known_model_ids() == frozenset()
+
+            csv_path.write_text("id\nstable/model\n")
+
+            assert data_manager.get_known_model_ids() == frozenset({"stable/model"})
+
     def test_model_usage_tracking(self, data_manager, sample_experimental_model):
         """Test usage statistics tracking."""
         # Add model
@@ -228,6 +274,58 @@ class TestAPIServer:
             assert analysis["complexity_level"] == "moderate"
             assert "algorithm" in analysis["indicators"]
 
+    @pytest.mark.asyncio
+    async def test_select_optimal_model_skips_alternatives(self, api_server):
+        """Test that execution model selection only routes the primary model."""
+        router = Mock()
+        selected_model = Mock(display_name="Model", tier="free", cost_per_token=0)
+        selected_model.name = "test/model"
+        router.select_optimal_model.return_value = selected_model
+        router.get_fallback_models.return_value = []
+        api_server.model_router = router
+        analysis = {"complexity_score": 0.5, "task_type": "general"}
+
+        selected = await api_server._select_optimal_model(analysis, "premium", "stable", True)
+
+        assert selected["model_id"] == "test/model"
+        assert selected["model_name"] == "Model"
+        router.get_fallback_models.assert_not_called()
+
+        recommendations = await api_server._get_routing_recommendations(analysis, "premium")
+        assert recommendations["primary"] == selected
+        router.get_fallback_models.assert_called_once()
+
+    def test_mock_delay_invalid_env_falls_back(self, monkeypatch):
+        """Test that a malformed PROMPTCRAFT_MOCK_DELAY falls back to the default."""
+        from plugins.promptcraft_system import api_server as api_module
+
+        monkeypatch.setenv("PROMPTCRAFT_MOCK_DELAY", "fast")
+        assert api_module._mock_delay_from_env() == 0.1
+
+        monkeypatch.setenv("PROMPTCRAFT_MOCK_DELAY", "0")
+        assert api_module._mock_delay_from_env() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_mock_execution_delay_configurable(self, api_server, monkeypatch):
+        """Test that the simulated execution delay can be disabled."""
+        from plugins.promptcraft_system import api_server as api_module
+
+        monkeypatch.setattr(api_module, "MOCK_EXECUTION_DELAY", 0.0)
+        with patch("asyncio.sleep") as mock_sleep:
+            result = await api_server._execute_with_model("prompt", {"model_id": "test/model"}, {})
+
+        assert result["success"]
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_models_by_channel(self, api_server, data_manager, sample_experimental_model):
+        """Test channel lookups return data manager models."""
+        data_manager.add_experimental_model(sample_experimental_model)
+
+        models = await api_server._get_models_by_channel("experimental", None)
+
+        assert [m["id"] for m in models] == [sample_experimental_model.id]
+
     def test_display_name_generation(self, api_server):
         """Test model display name formatting."""
         # Test free model
@@ -255,6 +353,113 @@ class TestAPIServer:
         assert "🆓" not in display_name
         assert "Premium Model" in display_name
 
+    def test_rate_limiting(self, api_server, monkeypatch):
+        """Test that rate-limited endpoints reject requests once the bucket is empty."""
+        from fastapi.testclient import TestClient
+
+        from plugins.promptcraft_system import api_server as api_module
+
+        monkeypatch.setattr(api_module, "RATE_LIMIT_CAPACITY", 2)
+
+        client = TestClient(api_server.app)
+        statuses = [client.get("/api/promptcraft/models/available").status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+        # Buckets belong to the server, so a second server starts fresh
+        other_server = PromptCraftAPIServer(api_server.data_manager)
+        assert TestClient(other_server.app).get("/api/promptcraft/models/available").status_code == 200
+        # Unlimited endpoints are unaffected
+        assert client.get("/health").status_code == 200
+
+    def test_available_models_cached(self, api_server):
+        """Test that repeated model list requests are served from the cache."""
+        from fastapi.testclient import TestClient
+
+        client = TestClient(api_server.app)
+        with patch.object(api_server, "_get_models_by_channel", return_value=[]) as mock_get:
+            first = client.get("/api/promptcraft/models/available", params={"channel": "experimental"})
+            second = client.get("/api/promptcraft/models/available", params={"channel": "experimental"})
+
+        assert first.json() == second.json()
+        assert mock_get.call_count == 1
+
+        # Expired entries are rebuilt
+        api_server.models_cache_ttl = 0.0
+        with patch.object(api_server, "_get_models_by_channel", return_value=[]) as mock_get:
+            client.get("/api/promptcraft/models/available", params={"channel": "experimental"})
+        assert mock_get.call_count == 1
+
+    def test_unhandled_errors_return_500(self, api_server):
+        """Test that endpoint errors become 500 responses and are counted."""
+        from fastapi.testclient import TestClient
+
+        client = TestClient(api_server.app)
+        with patch.object(api_server.data_manager, "get_stats", side_effect=RuntimeError("disk gone")):
+            response = client.get("/api/promptcraft/system/stats", headers={"Origin": "http://localhost:7860"})
+
+        assert response.status_code == 500
+        # Browser clients can still read the error
+        assert response.headers["access-control-allow-origin"] == "http://localhost:7860"
+        # Internal error details are logged, not sent to the client
+        assert response.json() == {"detail": "Internal server error"}
+        assert api_server.request_count == 1
+        assert api_server.successful_requests == 0
+
+    def test_uptime_and_timestamp(self, api_server):
+        """Test uptime tracking and cached response timestamps."""
+        from plugins.promptcraft_system import api_server as api_module
+
+        api_server._start_time -= 5
+        assert api_server.get_metrics()["uptime"] >= 5
+
+        timestamp = api_module._current_timestamp()
+        assert datetime.fromisoformat(timestamp)
+        assert api_module._current_timestamp() == timestamp
+
+    def test_oversized_requests_rejected(self, api_server):
+        """Test that oversized bodies and prompts are refused before analysis."""
+        from fastapi.testclient import TestClient
+
+        from plugins.promptcraft_system import api_server as api_module
+
+        client = TestClient(api_server.app)
+        url = "/api/promptcraft/route/analyze"
+
+        too_long = {"prompt": "x" * (api_module.MAX_PROMPT_LENGTH + 1), "user_tier": "free"}
+        assert client.post(url, json=too_long).status_code == 422
+
+        too_large = {"prompt": "x" * api_module.MAX_REQUEST_BODY_BYTES, "user_tier": "free"}
+        response = client.post(url, json=too_large, headers={"Origin": "http://localhost:7860"})
+        assert response.status_code == 413
+        # Cross-origin clients can read the rejection
+        assert response.headers["access-control-allow-origin"] == "http://localhost:7860"
+
+    def test_orjson_responses(self, api_server):
+        """Test that endpoints render JSON through the configured response class."""
+        from fastapi.testclient import TestClient
+
+        from plugins.promptcraft_system import api_server as api_module
+
+        if api_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        assert api_server.app.router.default_response_class is api_module.ORJSONResponse
+        response = TestClient(api_server.app).get("/health")
+        assert response.json()["status"] == "healthy"
+
+    def test_timing_header(self, api_server, monkeypatch):
+        """Test the X-Process-Time header format and toggle."""
+        from fastapi.testclient import TestClient
+
+        from plugins.promptcraft_system import api_server as api_module
+
+        client = TestClient(api_server.app)
+        header = client.get("/health").headers["X-Process-Time"]
+        assert len(header.split(".")[1]) == 6
+
+        monkeypatch.setattr(api_module, "EMIT_TIMING_HEADER", False)
+        assert "X-Process-Time" not in client.get("/health").headers
+
 
 class TestBackgroundWorkers:
     """Test background worker functionality."""
@@ -265,6 +470,7 @@ class TestBackgroundWorkers:
         mock = Mock()
         mock.get_experimental_models.return_value = []
         mock.get_models_by_channel.return_value = []
+        mock.get_known_model_ids.return_value = frozenset()
         mock.get_graduation_criteria.return_value = {
             "minimum_age_days": 7,
             "minimum_usage_requests": 50,
@@ -284,7 +490,7 @@ class TestBackgroundWorkers:
         assert worker.check_interval_hours == 1
         assert not worker.running
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_detection_cycle(self, mock_get, mock_data_manager):
         """Test model detection cycle."""
         # Mock OpenRouter API response
@@ -309,7 +515,7 @@ class TestBackgroundWorkers:
         mock_get.return_value = mock_response
 
         # Mock data manager responses
-        mock_data_manager.add_experimental_model.return_value = True
+        mock_data_manager.add_experimental_models.return_value = 1
 
         worker = ModelDetectionWorker(mock_data_manager, check_interval_hours=1)
 
@@ -319,8 +525,114 @@ class TestBackgroundWorkers:
         # Verify OpenRouter API was called
         mock_get.assert_called_once()
 
-        # Verify data manager was called (only for models that pass filters)
-        mock_data_manager.add_experimental_model.assert_called()
+        # Verify data manager was called once (only for models that pass filters)
+        mock_data_manager.add_experimental_models.assert_called_once()
+        added = mock_data_manager.add_experimental_models.call_args.args[0]
+        assert [m.id for m in added] == ["new/valid-model:free"]
+
+    def test_cycle_timestamp_passed_through(self, mock_data_manager):
+        """Test that a cycle's timestamp is reused for new models and queue entries."""
+        now_iso = "2025-06-01T12:00:00"
+        detection_worker = ModelDetectionWorker(mock_data_manager)
+        model = detection_worker._build_experimental_model(
+            {"id": "acme/model", "context_length": 8000, "pricing": {"prompt": "0"}}, now_iso
+        )
+
+        assert model.added_date == now_iso
+
+        model.added_date = "2025-01-01T00:00:00Z"
+        model.usage_count = 100
+        model.success_rate = 0.97
+        model.humaneval_score = 85.0
+        graduation_worker = GraduationWorker(mock_data_manager)
+        candidate = graduation_worker._evaluate_graduation_eligibility(model, {}, now_iso=now_iso)
+
+        assert candidate.added_to_queue == now_iso
+
+    @patch("requests.Session.get")
+    def test_fetch_uses_conditional_requests(self, mock_get, mock_data_manager):
+        """Test that unchanged OpenRouter catalogues are reused on 304 responses."""
+        models = [{"id": "new/model:free"}]
+        first = Mock(status_code=200, headers={"ETag": '"abc"'})
+        first.json.return_value = {"data": models}
+        not_modified = Mock(status_code=304, headers={})
+        mock_get.side_effect = [first, not_modified]
+
+        worker = ModelDetectionWorker(mock_data_manager)
+
+        assert worker._fetch_openrouter_models() == models
+        assert worker._fetch_openrouter_models() == models
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        not_modified.json.assert_not_called()
+        assert mock_get.call_count == 2
+
+    def test_detection_worker_stop_closes_session(self, mock_data_manager):
+        """Test that stopping the detection worker closes its HTTP session."""
+        worker = ModelDetectionWorker(mock_data_manager)
+
+        with patch.object(worker._session, "close") as mock_close:
+            worker.stop()
+
+        mock_close.assert_called_once()
+        assert worker.stop_event.is_set()
+
+    def test_quality_filters(self, mock_data_manager):
+        """Test context, provider and pricing filters on new models."""
+        worker = ModelDetectionWorker(mock_data_manager)
+        models = [
+            {"id": "good/model", "context_length": 8000, "pricing": {"prompt": "0"}},
+            {"id": "good/tiny", "context_length": 2000, "pricing": {"prompt": "0"}},
+            {"id": "Test/model", "context_length": 8000, "pricing": {"prompt": "0"}},
+            {"id": "acme/demo-model", "context_length": 8000, "pricing": {"prompt": "0"}},
+            {"id": "good/unpriced", "context_length": 8000, "pricing": {}},
+        ]
+
+        qualified = worker._apply_quality_filters(models)
+
+        assert [m["id"] for m in qualified] == ["good/model"]
+
+    def test_graduation_cycle_reads_criteria_once(self, mock_data_manager):
+        """Test that a graduation cycle loads its criteria once for all candidates."""
+        mock_data_manager.get_experimental_models.return_value = [
+            ExperimentalModel(
+                id=f"qualified/model-{i}:free",
+                name="Qualified Model",
+                provider="qualified",
+                cost_per_token=0.0,
+                context_window=8000,
+                added_date="2025-01-01T00:00:00Z",
+                usage_count=100,
+                success_rate=0.97,
+                humaneval_score=85.0,
+            )
+            for i in range(3)
+        ]
+
+        worker = GraduationWorker(mock_data_manager)
+        worker._graduation_cycle()
+
+        mock_data_manager.get_graduation_criteria.assert_called_once()
+        assert mock_data_manager.add_to_graduation_queue.call_count == 3
+
+    def test_graduation_eligibility_naive_added_date(self, mock_data_manager):
+        """Test that naive local timestamps from the detection worker can graduate."""
+        worker = GraduationWorker(mock_data_manager)
+        model = ExperimentalModel(
+            id="detected/model:free",
+            name="Detected Model",
+            provider="detected",
+            cost_per_token=0.0,
+            context_window=8000,
+            added_date="2025-01-01T00:00:00",
+            usage_count=100,
+            success_rate=0.97,
+            humaneval_score=85.0,
+        )
+
+        candidate = worker._evaluate_graduation_eligibility(model, {"minimum_age_days": 7})
+
+        assert candidate is not None
+        assert candidate.days_in_experimental >= 7
 
     def test_graduation_worker_init(self, mock_data_manager):
         """Test graduation worker initialization."""
@@ -361,6 +673,83 @@ class TestBackgroundWorkers:
         assert candidate.graduation_score >= 7.5  # Should meet threshold
         assert all(candidate.criteria_met.values())
 
+    def test_graduation_eligibility_rejects_unmet_criteria(self, mock_data_manager):
+        """Test that failing any single criterion yields no candidate."""
+        worker = GraduationWorker(mock_data_manager)
+        base = {
+            "id": "candidate/model:free",
+            "name": "Candidate Model",
+            "provider": "candidate",
+            "cost_per_token": 0.0,
+            "context_window": 8000,
+            "added_date": "2025-01-01T00:00:00Z",
+            "usage_count": 100,
+            "success_rate": 0.97,
+            "humaneval_score": 85.0,
+        }
+        criteria = {"minimum_age_days": 7, "minimum_usage_requests": 50, "minimum_success_rate": 0.95}
+
+        for override in ({"usage_count": 10}, {"success_rate": 0.5}, {"humaneval_score": None}):
+            model = ExperimentalModel(**{**base, **override})
+            assert worker._evaluate_graduation_eligibility(model, criteria) is None
+
+    def test_worker_trigger_and_stop_wake_immediately(self, mock_data_manager):
+        """Test that trigger_now() runs a cycle early and stop() ends the wait."""
+        worker = GraduationWorker(mock_data_manager, check_interval_hours=24)
+        cycles = threading.Event()
+
+        with patch.object(worker, "_graduation_cycle", side_effect=cycles.set):
+            thread = threading.Thread(target=worker.start, daemon=True)
+            thread.start()
+
+            worker.set_interval(12)
+            worker.trigger_now()
+            assert cycles.wait(5)
+
+            worker.stop()
+            thread.join(5)
+
+        assert worker.check_interval_hours == 12
+        assert not thread.is_alive()
+
+    def test_worker_manager_uses_single_scheduler_thread(self, mock_data_manager):
+        """Test that all workers share one scheduler thread and can be triggered."""
+        manager = WorkerManager(mock_data_manager)
+        detection_ran = threading.Event()
+        graduation_ran = threading.Event()
+
+        detection_patch = patch.object(ModelDetectionWorker, "run_cycle", side_effect=detection_ran.set)
+        graduation_patch = patch.object(GraduationWorker, "run_cycle", side_effect=graduation_ran.set)
+
+        with detection_patch, graduation_patch:
+            manager.start_all_workers()
+            try:
+                status = manager.get_worker_status()
+                assert status["total_workers"] == 2
+                assert {w["thread_name"] for w in status["workers"].values()} == {"PromptCraftWorkers"}
+
+                manager.trigger_now()
+                assert detection_ran.wait(5)
+                assert graduation_ran.wait(5)
+            finally:
+                manager.stop_all_workers()
+
+        manager._thread.join(5)
+        assert not manager._thread.is_alive()
+
+    def test_worker_manager_trigger_during_cycle_runs_next(self, mock_data_manager):
+        """Test that a trigger arriving mid-cycle queues the next check immediately."""
+        manager = WorkerManager(mock_data_manager)
+        worker = GraduationWorker(mock_data_manager)
+        manager.workers["graduation"] = {"worker": worker, "event": None}
+
+        worker.trigger_now()
+        with patch.object(GraduationWorker, "run_cycle", side_effect=worker.trigger_now):
+            manager._run_worker("graduation")
+
+        event = manager.workers["graduation"]["event"]
+        assert event.time <= time.monotonic()
+
 
 class TestPluginIntegration:
     """Test complete plugin integration."""
@@ -155,12 +155,13 @@ def test_background_workers():
         # Test 3: Mock detection cycle (without external API call)
         mock_data_manager.get_experimental_models.return_value = []
         mock_data_manager.get_models_by_channel.return_value = []
+        mock_data_manager.get_known_model_ids.return_value = frozenset()
         mock_data_manager.get_graduation_criteria.return_value = {
             "detection_config": {"quality_filters": {"min_context_window": 4000, "exclude_providers": ["test"]}}
         }
 
         # Mock successful OpenRouter response
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = {"data": []}
             mock_response.raise_for_status.return_value = None
@@ -255,6 +255,41 @@ class TestModelLevelRouter:
         assert result1.model.name == result2.model.name
         assert result1.confidence == result2.confidence
 
+    def test_cache_is_bounded(self):
+        """Test that the routing cache evicts least recently used entries."""
+        self.router.max_cache_size = 2
+
+        self.router.select_model("first prompt")
+        self.router.select_model("second prompt")
+        self.router.select_model("first prompt")  # Refresh recency
+        self.router.select_model("third prompt")
+
+        assert len(self.router.cache) == 2
+        assert self.router._get_cache_key("second prompt", None, True, None) not in self.router.cache
+        assert self.router._get_cache_key("first prompt", None, True, None) in self.router.cache
+
+    def test_cache_key_covers_routing_fields(self):
+        """Test that cache keys reflect routing fields exactly and ignore unrelated context."""
+        key = self.router._get_cache_key
+
+        clean = key("prompt", {"tool_name": "chat"}, True, None)
+        assert clean != key("prompt", {"file_types": None, "tool_name": "chat"}, True, None)
+        # Same-length code with different contents must not share a key
+        assert key("prompt", {"existing_code": "a = 1"}, True, None) != key(
+            "prompt", {"existing_code": "b = 2"}, True, None
+        )
+        assert key("prompt", {"files": ["a.py", "b.py"]}, True, None) != key(
+            "prompt", {"files": ["a.pyb.py"]}, True, None
+        )
+        # Fields routing never reads do not affect the key
+        assert key("prompt", {"tool_name": "chat", "history": ["long session"]}, True, None) == clean
+
+    def test_malformed_context_does_not_raise(self):
+        """Test that a malformed context falls back instead of failing selection."""
+        result = self.router.select_model("Fix this bug", context={"file_types": 5})
+
+        assert result.model is not None
+
     def test_routing_statistics(self):
         """Test routing statistics collection."""
         # Make some routing decisions